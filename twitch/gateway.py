@@ -110,7 +110,7 @@ class EventSubWebSocket:
             # Get default events.
             events = {attr.replace('on_', '', 1) for attr in dir(client) if attr.startswith('on_')}
             # Add additional default events.
-            events.update({'channel_update', 'user_update', 'stream_online', 'stream_offline'})
+            events.update(state.DEFAULT_EVENTS)
             task = ws.create_subscriptions(events=events, initial=initial)
             ws._subscriptions_task = client.loop.create_task(task, name='twitch:gateway:subscriptions')
         else:
@@ -26,8 +26,9 @@ from __future__ import annotations
 
 from .errors import (HTTPException, TwitchServerError, Forbidden, NotFound, AuthFailure, UnregisteredUser)
 from urllib.parse import quote as _uriquote
+from types import MappingProxyType
 from . import __version__, __github__
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 from .utils import json_or_text
 import aiohttp
 import asyncio
@@ -37,7 +38,7 @@ import time
 if TYPE_CHECKING:
     from .types import (Data, DTData, Edata, PData, TData, TPData, activity, analytics, bits, chat, channels,
                         interaction, moderation, search, streams, users, PEdata, TTMData)
-    from typing import Any, ClassVar, Coroutine, Dict, List, Literal, Optional, TypeVar, Union
+    from typing import Any, ClassVar, Coroutine, Dict, List, Literal, Mapping, Optional, TypeVar, Union
 
     T = TypeVar('T')
     Response = Coroutine[Any, Any, T]
@@ -48,6 +49,386 @@ _logger = logging.getLogger(__name__)
 __all__ = ('HTTPClient',)
 
 
+class SubscriptionCondition(NamedTuple):
+    """Represents which EventSub condition keys receive the broadcaster and user IDs."""
+    broadcaster: Optional[str]
+    user: Optional[str]
+
+
+class SubscriptionInfo(NamedTuple):
+    """Represents the EventSub type, version and condition keys of an event."""
+    name: str
+    version: str
+    condition: SubscriptionCondition
+
+
+# Warning: This dictionary may be updated anytime based on new event types or API changes.
+# It maps subscription types to their respective Twitch event name, version and condition keys.
+# Frozen so no caller can mutate the shared table through a returned entry.
+_SUBSCRIPTIONS: Mapping[str, SubscriptionInfo] = MappingProxyType({
+    'automod_message_hold': SubscriptionInfo(
+        name='automod.message.hold',
+        version='2',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'automod_message_update': SubscriptionInfo(
+        name='automod.message.update',
+        version='2',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'automod_settings_update': SubscriptionInfo(
+        name='automod.settings.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'automod_terms_update': SubscriptionInfo(
+        name='automod.terms.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'bits_use': SubscriptionInfo(
+        name='channel.bits.use',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'channel_update': SubscriptionInfo(
+        name='channel.update',
+        version='2',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'follow': SubscriptionInfo(
+        name='channel.follow',
+        version='2',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'ad_break_begin': SubscriptionInfo(
+        name='channel.ad_break.begin',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'chat_clear': SubscriptionInfo(
+        name='channel.chat.clear',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'chat_clear_user_messages': SubscriptionInfo(
+        name='channel.chat.clear_user_messages',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'chat_message': SubscriptionInfo(
+        name='channel.chat.message',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'chat_message_delete': SubscriptionInfo(
+        name='channel.chat.message_delete',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'chat_notification': SubscriptionInfo(
+        name='channel.chat.notification',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'chat_settings_update': SubscriptionInfo(
+        name='channel.chat_settings.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'chat_user_message_hold': SubscriptionInfo(
+        name='channel.chat.user_message_hold',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'chat_user_message_update': SubscriptionInfo(
+        name='channel.chat.user_message_update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='user_id', user='broadcaster_user_id')
+    ),
+    'shared_chat_begin': SubscriptionInfo(
+        name='channel.shared_chat.begin',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'shared_chat_update': SubscriptionInfo(
+        name='channel.shared_chat.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'shared_chat_end': SubscriptionInfo(
+        name='channel.shared_chat.end',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'subscribe': SubscriptionInfo(
+        name='channel.subscribe',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'subscription_end': SubscriptionInfo(
+        name='channel.subscription.end',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'subscription_gift': SubscriptionInfo(
+        name='channel.subscription.gift',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'subscription_message': SubscriptionInfo(
+        name='channel.subscription.message',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'cheer': SubscriptionInfo(
+        name='channel.cheer',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'raid': SubscriptionInfo(
+        name='channel.raid',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='to_broadcaster_user_id')
+    ),
+    'ban': SubscriptionInfo(
+        name='channel.ban',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'unban': SubscriptionInfo(
+        name='channel.unban',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'unban_request_create': SubscriptionInfo(
+        name='channel.unban_request.create',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'unban_request_resolve': SubscriptionInfo(
+        name='channel.unban_request.resolve',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'channel_moderate': SubscriptionInfo(
+        name='channel.moderate',
+        version='2',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'moderator_add': SubscriptionInfo(
+        name='channel.moderator.add',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'moderator_remove': SubscriptionInfo(
+        name='channel.moderator.remove',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'points_automatic_reward_redemption_add_v1': SubscriptionInfo(
+        name='channel.channel_points_automatic_reward_redemption.add',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'points_automatic_reward_redemption_add_v2': SubscriptionInfo(
+        name='channel.channel_points_automatic_reward_redemption.add',
+        version='2',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'points_reward_add': SubscriptionInfo(
+        name='channel.channel_points_custom_reward.add',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'points_reward_update': SubscriptionInfo(
+        name='channel.channel_points_custom_reward.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'points_reward_remove': SubscriptionInfo(
+        name='channel.channel_points_custom_reward.remove',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'points_reward_redemption_add': SubscriptionInfo(
+        name='channel.channel_points_custom_reward_redemption.add',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'points_reward_redemption_update': SubscriptionInfo(
+        name='channel.channel_points_custom_reward_redemption.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'poll_begin': SubscriptionInfo(
+        name='channel.poll.begin',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'poll_progress': SubscriptionInfo(
+        name='channel.poll.progress',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'poll_end': SubscriptionInfo(
+        name='channel.poll.end',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'prediction_begin': SubscriptionInfo(
+        name='channel.prediction.begin',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'prediction_progress': SubscriptionInfo(
+        name='channel.prediction.progress',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'prediction_lock': SubscriptionInfo(
+        name='channel.prediction.lock',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'prediction_end': SubscriptionInfo(
+        name='channel.prediction.end',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'suspicious_user_message': SubscriptionInfo(
+        name='channel.suspicious_user.message',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'suspicious_user_update': SubscriptionInfo(
+        name='channel.suspicious_user.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'vip_add': SubscriptionInfo(
+        name='channel.vip.add',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'vip_remove': SubscriptionInfo(
+        name='channel.vip.remove',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'warning_acknowledge': SubscriptionInfo(
+        name='channel.warning.acknowledge',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'warning_send': SubscriptionInfo(
+        name='channel.warning.send',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'charity_campaign_donate': SubscriptionInfo(
+        name='channel.charity_campaign.donate',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'charity_campaign_start': SubscriptionInfo(
+        name='channel.charity_campaign.start',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'charity_campaign_progress': SubscriptionInfo(
+        name='channel.charity_campaign.progress',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'charity_campaign_stop': SubscriptionInfo(
+        name='channel.charity_campaign.stop',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'goal_begin': SubscriptionInfo(
+        name='channel.goal.begin',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'goal_progress': SubscriptionInfo(
+        name='channel.goal.progress',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'goal_end': SubscriptionInfo(
+        name='channel.goal.end',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'hype_train_begin': SubscriptionInfo(
+        name='channel.hype_train.begin',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'hype_train_progress': SubscriptionInfo(
+        name='channel.hype_train.progress',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'hype_train_end': SubscriptionInfo(
+        name='channel.hype_train.end',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'shield_mode_begin': SubscriptionInfo(
+        name='channel.shield_mode.begin',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'shield_mode_end': SubscriptionInfo(
+        name='channel.shield_mode.end',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'shoutout_create': SubscriptionInfo(
+        name='channel.shoutout.create',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'shoutout_received': SubscriptionInfo(
+        name='channel.shoutout.receive',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='moderator_user_id', user='broadcaster_user_id')
+    ),
+    'stream_online': SubscriptionInfo(
+        name='stream.online',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'stream_offline': SubscriptionInfo(
+        name='stream.offline',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='broadcaster_user_id')
+    ),
+    'user_authorization_grant': SubscriptionInfo(
+        name='user.authorization.grant',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='broadcaster_id', user=None)
+    ),
+    'user_authorization_revoke': SubscriptionInfo(
+        name='user.authorization.revoke',
+        version='1',
+        condition=SubscriptionCondition(broadcaster='broadcaster_id', user=None)
+    ),
+    'user_update': SubscriptionInfo(
+        name='user.update',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='user_id')
+    ),
+    'whisper_received': SubscriptionInfo(
+        name='user.whisper.message',
+        version='1',
+        condition=SubscriptionCondition(broadcaster=None, user='user_id')
+    )
+})
+
+
 class Route:
     """Represents HTTP route."""
     BASE: ClassVar[str] = 'https://api.twitch.tv/helix/'
@@ -349,372 +730,9 @@ class HTTPClient:
             await asyncio.sleep(self.KEEP_ALIVE_LOOP)
 
     @staticmethod
-    def get_subscription_info(event: str) -> Optional[Dict[str, Any]]:
-        # Warning: This dictionary may be updated anytime based on new event types or API changes.
-        # It maps subscription types to their respective Twitch event name and version.
-        subscriptions: Dict[str, Dict[str, Any]] = {
-            'automod_message_hold': {
-                'name': 'automod.message.hold',
-                'version': '2',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'automod_message_update': {
-                'name': 'automod.message.update',
-                'version': '2',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'automod_settings_update': {
-                'name': 'automod.settings.update',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'automod_terms_update': {
-                'name': 'automod.terms.update',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'bits_use': {
-                'name': 'channel.bits.use',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'channel_update': {
-                'name': 'channel.update',
-                'version': '2',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'follow': {
-                'name': 'channel.follow',
-                'version': '2',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'ad_break_begin': {
-                'name': 'channel.ad_break.begin',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'chat_clear': {
-                'name': 'channel.chat.clear',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'chat_clear_user_messages': {
-                'name': 'channel.chat.clear_user_messages',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'chat_message': {
-                'name': 'channel.chat.message',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'chat_message_delete': {
-                'name': 'channel.chat.message_delete',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'chat_notification': {
-                'name': 'channel.chat.notification',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'chat_settings_update': {
-                'name': 'channel.chat_settings.update',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'chat_user_message_hold': {
-                'name': 'channel.chat.user_message_hold',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'chat_user_message_update': {
-                'name': 'channel.chat.user_message_update',
-                'version': '1',
-                'condition': {'broadcaster': 'user_id', 'user': 'broadcaster_user_id'}
-            },
-            'shared_chat_begin': {
-                'name': 'channel.shared_chat.begin',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'shared_chat_update': {
-                'name': 'channel.shared_chat.update',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'shared_chat_end': {
-                'name': 'channel.shared_chat.end',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'subscribe': {
-                'name': 'channel.subscribe',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'subscription_end': {
-                'name': 'channel.subscription.end',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'subscription_gift': {
-                'name': 'channel.subscription.gift',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'subscription_message': {
-                'name': 'channel.subscription.message',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'cheer': {
-                'name': 'channel.cheer',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'raid': {
-                'name': 'channel.raid',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'to_broadcaster_user_id'}
-            },
-            'ban': {
-                'name': 'channel.ban',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'unban': {
-                'name': 'channel.unban',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'unban_request_create': {
-                'name': 'channel.unban_request.create',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'unban_request_resolve': {
-                'name': 'channel.unban_request.resolve',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'channel_moderate': {
-                'name': 'channel.moderate',
-                'version': '2',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'moderator_add': {
-                'name': 'channel.moderator.add',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'moderator_remove': {
-                'name': 'channel.moderator.remove',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'points_automatic_reward_redemption_add_v1': {
-                'name': 'channel.channel_points_automatic_reward_redemption.add',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'points_automatic_reward_redemption_add_v2': {
-                'name': 'channel.channel_points_automatic_reward_redemption.add',
-                'version': '2',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'points_reward_add': {
-                'name': 'channel.channel_points_custom_reward.add',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'points_reward_update': {
-                'name': 'channel.channel_points_custom_reward.update',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'points_reward_remove': {
-                'name': 'channel.channel_points_custom_reward.remove',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'points_reward_redemption_add': {
-                'name': 'channel.channel_points_custom_reward_redemption.add',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'points_reward_redemption_update': {
-                'name': 'channel.channel_points_custom_reward_redemption.update',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'poll_begin': {
-                'name': 'channel.poll.begin',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'poll_progress': {
-                'name': 'channel.poll.progress',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'poll_end': {
-                'name': 'channel.poll.end',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'prediction_begin': {
-                'name': 'channel.prediction.begin',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'prediction_progress': {
-                'name': 'channel.prediction.progress',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'prediction_lock': {
-                'name': 'channel.prediction.lock',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'prediction_end': {
-                'name': 'channel.prediction.end',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'suspicious_user_message': {
-                'name': 'channel.suspicious_user.message',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'suspicious_user_update': {
-                'name': 'channel.suspicious_user.update',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'vip_add': {
-                'name': 'channel.vip.add',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'vip_remove': {
-                'name': 'channel.vip.remove',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'warning_acknowledge': {
-                'name': 'channel.warning.acknowledge',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'warning_send': {
-                'name': 'channel.warning.send',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'charity_campaign_donate': {
-                'name': 'channel.charity_campaign.donate',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'charity_campaign_start': {
-                'name': 'channel.charity_campaign.start',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'charity_campaign_progress': {
-                'name': 'channel.charity_campaign.progress',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'charity_campaign_stop': {
-                'name': 'channel.charity_campaign.stop',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'goal_begin': {
-                'name': 'channel.goal.begin',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'goal_progress': {
-                'name': 'channel.goal.progress',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'goal_end': {
-                'name': 'channel.goal.end',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'hype_train_begin': {
-                'name': 'channel.hype_train.begin',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'hype_train_progress': {
-                'name': 'channel.hype_train.progress',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'hype_train_end': {
-                'name': 'channel.hype_train.end',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'shield_mode_begin': {
-                'name': 'channel.shield_mode.begin',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'shield_mode_end': {
-                'name': 'channel.shield_mode.end',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'shoutout_create': {
-                'name': 'channel.shoutout.create',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'shoutout_received': {
-                'name': 'channel.shoutout.receive',
-                'version': '1',
-                'condition': {'broadcaster': 'moderator_user_id', 'user': 'broadcaster_user_id'}
-            },
-            'stream_online': {
-                'name': 'stream.online',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'stream_offline': {
-                'name': 'stream.offline',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'broadcaster_user_id'}
-            },
-            'user_authorization_grant': {
-                'name': 'user.authorization.grant',
-                'version': '1',
-                'condition': {'broadcaster': 'broadcaster_id', 'user': None}
-            },
-            'user_authorization_revoke': {
-                'name': 'user.authorization.revoke',
-                'version': '1',
-                'condition': {'broadcaster': 'broadcaster_id', 'user': None}
-            },
-            'user_update': {
-                'name': 'user.update',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'user_id'}
-            },
-            'whisper_received': {
-                'name': 'user.whisper.message',
-                'version': '1',
-                'condition': {'broadcaster': None, 'user': 'user_id'}
-            }
-        }
-        return subscriptions.get(event)
+    def get_subscription_info(event: str) -> Optional[SubscriptionInfo]:
+        """Retrieve the EventSub type, version and condition keys for an event."""
+        return _SUBSCRIPTIONS.get(event)
 
     def create_subscription(
             self,
@@ -725,7 +743,8 @@ class HTTPClient:
             *,
             subscription_type: str,
             subscription_version: str,
-            subscription_condition: Dict[str, Any]
+            subscription_condition: SubscriptionCondition,
+            condition_options: Optional[Dict[str, Any]] = None
     ) -> Response[TTMData[List[users.EventSubSubscription]]]:
         """Create an EventSub Websocket Subscription."""
         route = Route(__id, 'POST', 'eventsub/subscriptions')
@@ -735,15 +754,19 @@ class HTTPClient:
         condition = {}
 
         # Ensure 'broadcaster' key is properly assigned
-        client_key = subscription_condition.get('broadcaster')
+        client_key = subscription_condition.broadcaster
         if client_key:
             condition[client_key] = broadcaster_id
 
         # Ensure 'user' key is properly assigned
-        user_key = subscription_condition.get('user')
+        user_key = subscription_condition.user
         if user_key:
             condition[user_key] = user_id
 
+        # Extra event-specific conditions, e.g. a reward_id for reward redemptions.
+        if condition_options:
+            condition.update(condition_options)
+
         body = {
             'type': subscription_type,
             'version': subscription_version,
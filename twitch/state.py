@@ -34,9 +34,9 @@ import asyncio
 
 if TYPE_CHECKING:
     from .types import Data, TTMData, users, Edata, chat, channels, search, PData, streams, bits, analytics, eventsub
-    from typing import List, Tuple, Literal, Callable, Any, Optional, Dict, AsyncGenerator
+    from typing import List, Tuple, Literal, Callable, Any, Optional, Dict, AsyncGenerator, ClassVar, FrozenSet
     from .types.eventsub import MPData
-    from .http import HTTPClient
+    from .http import HTTPClient, SubscriptionInfo
 
 import logging
 _logger = logging.getLogger(__name__)
@@ -48,6 +48,10 @@ class ConnectionState:
     """
     Represents the state of the connection.
     """
+    # Events the client always subscribes to for itself to keep its own state up to date.
+    DEFAULT_EVENTS: ClassVar[FrozenSet[str]] = frozenset({'channel_update', 'user_update', 'stream_online',
+                                                          'stream_offline'})
+
     __slots__ = ('http', 'user', 'is_live', '__dispatch', '__custom_dispatch', '_return_full_data',
                  '_events', 'ready', 'total_cost', 'max_total_cost', '_users', '_socket_debug', '_broadcasters',
                  '_lock')
@@ -158,30 +162,28 @@ class ConnectionState:
                                   callbacks: Optional[List[Callable[..., Any]]] = None,
                                   condition_options: Optional[Dict[str, Any]] = None) -> None:
         """Creates a subscription for the given event and user, and manages event callbacks."""
-        subscription: Optional[Dict[str, Any]] = self.http.get_subscription_info(event)
+        subscription: Optional[SubscriptionInfo] = self.http.get_subscription_info(event)
 
         if callbacks is not None and subscription is None:
             raise TypeError(f'Unknown event: `on_{event}` is not a recognized event.')
 
         if subscription is not None:
             async with self._lock:
-                if self._events.setdefault(user_id, {}).get(subscription['name']) is None:
-                    if condition_options:
-                        subscription.update(subscription['name'])
-
+                if self._events.setdefault(user_id, {}).get(subscription.name) is None:
                     data: TTMData[List[users.EventSubSubscription]] = await self.http.create_subscription(
                         self.user.id,
                         self.user.id,
                         user_id,
                         session_id,
-                        subscription_type=subscription['name'],
-                        subscription_version=subscription['version'],
-                        subscription_condition=subscription['condition']
+                        subscription_type=subscription.name,
+                        subscription_version=subscription.version,
+                        subscription_condition=subscription.condition,
+                        condition_options=condition_options
                     )
-                    self._events[user_id][data['data'][0]['type'], subscription['version']] = {
+                    self._events[user_id][data['data'][0]['type'], subscription.version] = {
                         'id': data['data'][0]['id'],
                         'name': event,
-                        'version': subscription['version'],
+                        'version': subscription.version,
                         'condition_options': condition_options,
                         'callbacks': callbacks if callbacks is not None else [],
                         'auth_user_id': self.user.id
@@ -194,25 +196,22 @@ class ConnectionState:
                                         'Consider unsubscribing from some events.',
                                         data['total_cost'])
                 else:
-                    self._events[user_id][subscription['name']]['callbacks'] = list(dict.fromkeys(
-                        self._events[user_id][subscription['name']]['callbacks'] + callbacks
+                    self._events[user_id][subscription.name]['callbacks'] = list(dict.fromkeys(
+                        self._events[user_id][subscription.name]['callbacks'] + callbacks
                     ))
 
     async def remove_subscription(self, user_id: str, event: str) -> None:
         """Removes a subscription for the given event and user."""
-        subscription: Optional[Dict[str, str]] = self.http.get_subscription_info(event)
+        subscription: Optional[SubscriptionInfo] = self.http.get_subscription_info(event)
         if subscription is not None:
             async with self._lock:
-                if self._events.setdefault(user_id, {}).get(subscription['name']) is not None:
+                if self._events.setdefault(user_id, {}).get(subscription.name) is not None:
                     await self.http.delete_subscription(
                         self._events[user_id]['auth_user_id'],
-                        self._events[user_id][subscription['name'], subscription['version']]['id']
+                        self._events[user_id][subscription.name, subscription.version]['id']
                     )
-                    self._events[user_id].pop(subscription['name'], subscription['version'])
-                    if self.user.id == user_id and event in ['channel_update',
-                                                             'user_update',
-                                                             'stream_online',
-                                                             'stream_offline']:
+                    self._events[user_id].pop(subscription.name, subscription.version)
+                    if self.user.id == user_id and event in self.DEFAULT_EVENTS:
                         _logger.warning('Default client event `%s` removed. Unexpected behavior may occur.',
                                         event)
 
@@ -52,7 +52,7 @@ class BaseUser:
         id: str
 
     def __init__(self, user_id: str) -> None:
-        self._update(user_id=user_id)
+        self.id = user_id
 
     def __repr__(self) -> str:
         # Return a string representation of the BaseUser instance.
@@ -72,29 +72,13 @@ class BaseUser:
         bool
             True if the other object is a BaseUser with the same ID, False otherwise.
         """
-        if isinstance(other, BaseUser):
+        if other.__class__ is self.__class__ or isinstance(other, BaseUser):
             return self.id == other.id
         return False
 
-    def __ne__(self, other: object) -> bool:
-        """
-        Check if this user is not equal to another user.
-
-        Parameters
-        ----------
-        other: object
-            The object to compare with.
-
-        Returns
-        -------
-        bool
-            True if the other object is not a BaseUser or has a different ID, False otherwise.
-        """
-        return not self.__eq__(other)
-
-    def _update(self, user_id: str) -> None:
-        # Update the user's ID.
-        self.id = user_id
+    def __hash__(self) -> int:
+        # Hash by ID so users can be used as dict keys and set members.
+        return hash(self.id)
 
 
 class User(BaseUser):
@@ -29,6 +29,7 @@ import datetime
 import logging
 import json
 import time
+import sys
 
 if TYPE_CHECKING:
     from typing import Any, Union, Dict, Optional
@@ -36,6 +37,12 @@ if TYPE_CHECKING:
 
 __all__ = ('setup_logging', 'json_or_text', 'convert_rfc3339', 'datetime_to_str', 'ExponentialBackoff')
 
+_UTC = datetime.timezone.utc
+_FROMISO = datetime.datetime.fromisoformat
+# Python 3.11+ fromisoformat accepts the RFC3339 'Z' suffix natively.
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+_LOG_FORMATTER = logging.Formatter('[{asctime}] [{levelname}] {name}: {message}', '%Y-%m-%d %H:%M:%S', style='{')
+
 
 def setup_logging(*,
                   handler: Optional[logging.Handler] = None,
@@ -47,20 +54,20 @@ def setup_logging(*,
     if level is None:
         level = logging.INFO
 
-    if handler is None:
-        handler = logging.StreamHandler()
-
-    dt_fmt = '%Y-%m-%d %H:%M:%S'
-    formatter = logging.Formatter('[{asctime}] [{levelname}] {name}: {message}', dt_fmt, style='{')
-
     if root:
         logger = logging.getLogger()
     else:
         library, _, _ = __name__.partition('.')
         logger = logging.getLogger(library)
 
-    handler.setFormatter(formatter)
     logger.setLevel(level)
+    if handler is None:
+        # A previous call already attached the default handler; adding another would emit every record twice.
+        if any(type(h) is logging.StreamHandler and h.formatter is _LOG_FORMATTER for h in logger.handlers):
+            return
+        handler = logging.StreamHandler()
+
+    handler.setFormatter(_LOG_FORMATTER)
     logger.addHandler(handler)
 
 
@@ -68,11 +75,8 @@ async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any]
     """Read response from aiohttp.ClientResponse, parse as JSON if content-type is 'application/json',
     otherwise return response text."""
     text = await response.text(encoding='utf-8')
-    try:
-        if 'application/json' in response.headers['content-type']:
-            return json.loads(text)
-    except KeyError:
-        pass
+    if 'application/json' in response.headers.get('content-type', ''):
+        return json.loads(text)
     return text
 
 
@@ -80,16 +84,18 @@ def convert_rfc3339(timestamp: Optional[str]) -> Optional[datetime]:
     """
     Convert RFC3339 timestamp string to a datetime object (UTC +0).
     """
-    if timestamp.endswith('Z'):
-        timestamp = timestamp[:-1] + '+00:00'
-    return None if (not timestamp) else datetime.datetime.fromisoformat(timestamp)
+    if not timestamp:
+        return None
+    if not _FROMISO_ACCEPTS_Z and timestamp.endswith('Z'):
+        return _FROMISO(timestamp[:-1] + '+00:00')
+    return _FROMISO(timestamp)
 
 
 def datetime_to_str(__time: Optional[datetime], /) -> Optional[str]:
     """
     Convert local datetime object to UTC formatted RFC3339 timestamp string.
     """
-    return None if time is None else __time.astimezone(datetime.timezone.utc).isoformat()
+    return None if __time is None else __time.astimezone(_UTC).isoformat()
 
 
 class ExponentialBackoff:
@@ -133,7 +139,11 @@ class ExponentialBackoff:
         if elapsed_time > self.reset_interval:
             self.retry_count = 0
 
-        delay = min(self.base_delay * 2 ** self.retry_count, self.max_delay)
-        self.retry_count += 1
+        delay = self.base_delay * (1 << self.retry_count)
+        # Stop counting once the cap is reached so retry_count stays bounded during long outages.
+        if delay < self.max_delay:
+            self.retry_count += 1
+        else:
+            delay = self.max_delay
         self.last_failure_time = current_time
         return delay